@@ -5,8 +5,9 @@ os.environ['STREAMLIT_SERVER_FILE_WATCHER_TYPE'] = 'none'
 import chromadb
 
 from text_processor import parse_aneel_pdf, download_pdf_if_not_exists, PDF_URL, LOCAL_PDF_PATH
+from deduplication import deduplicate_chunks
 from vector_db import initialize_vector_db, query_vector_db, COLLECTION_NAME
-from chatbot_logic import generate_response_with_gemini
+from chatbot_logic import generate_response_with_gemini, NO_RESULTS_RESPONSE
 
 # --- Configuração ---
 CHROMA_PERSIST_DIR = r"./chroma_db_data"
@@ -26,6 +27,9 @@ def ensure_db_is_ready():
                 # Parse PDF and extract chunks with hierarchy
                 chunks_with_metadata = parse_aneel_pdf(LOCAL_PDF_PATH)
                 
+                # Collapse near-duplicate chunks (boilerplate, repeated definitions)
+                chunks_with_metadata, dedup_stats = deduplicate_chunks(chunks_with_metadata)
+                
                 # Extract just the text content for vector DB
                 text_chunks = [chunk["page_content"] for chunk in chunks_with_metadata]
                 
@@ -35,6 +39,17 @@ def ensure_db_is_ready():
                 # Initialize vector database with chunks and metadata
                 initialize_vector_db(text_chunks, metadatas, persist_directory=CHROMA_PERSIST_DIR)
                 
+                # Report the index size reduction and the embedding time it saved
+                import vector_db
+                embedding_stats = vector_db.last_embedding_stats
+                seconds_per_chunk = embedding_stats["embedding_seconds"] / max(embedding_stats["embedded_chunks"], 1)
+                st.info(
+                    f"Deduplicação: {dedup_stats['original_chunks']} → {dedup_stats['unique_chunks']} chunks "
+                    f"({dedup_stats['reduction_pct']:.1f}% menor). "
+                    f"Embedding de {embedding_stats['embedded_chunks']} chunks em {embedding_stats['embedding_seconds']:.1f}s; "
+                    f"economia estimada de {dedup_stats['removed_chunks'] * seconds_per_chunk:.1f}s."
+                )
+                
                 # Create flag file
                 with open(DB_READY_FLAG, 'w') as f:
                     f.write("Database initialized with PDF content")
@@ -174,7 +189,7 @@ if prompt := st.chat_input("Qual a sua pergunta sobre a REN 1000/2021 da ANEEL?"
             )
         
         if not retrieved_chunks:
-            full_response = "Desculpe, não consegui encontrar informações relevantes nos documentos consultados para responder à sua pergunta."
+            full_response = NO_RESULTS_RESPONSE
         else:
             # 2. Gera a resposta usando o modelo Gemini
             message_placeholder.markdown("**Gerando resposta...** 🤖")
@@ -192,6 +207,8 @@ if prompt := st.chat_input("Qual a sua pergunta sobre a REN 1000/2021 da ANEEL?"
                     st.caption(f"**Fonte {i+1}:**")
                     if metadata.get('full_hierarchical_path'):
                         st.caption(f"📍 **Localização:** {metadata['full_hierarchical_path']}")
+                    if metadata.get('duplicate_locations'):
+                        st.caption(f"🔁 **Também aparece em:** {metadata['duplicate_locations']}")
                     if use_reranking:
                         st.caption("🏆 **Reranked result**")
                     st.caption(f"📄 **Conteúdo:** {doc[:200]}...")
@@ -0,0 +1,156 @@
+import argparse
+import json
+import time
+
+from vector_db import query_vector_db, query_vector_db_batch
+from chatbot_logic import generate_responses_with_gemini_batch, NO_RESULTS_RESPONSE
+
+def answer_queries_batch(
+        query_texts: list[str],
+        num_results: int = 3,
+        use_reranking: bool = True,
+        initial_results: int = 10,
+        generate: bool = False,
+        max_workers: int = 4
+) -> list[dict]:
+    """
+    Processa uma lista de perguntas em lote: busca, reranking e, opcionalmente, geração de respostas.
+    Usa os mesmos parâmetros de busca da interface Streamlit (app.py).
+    :param query_texts: Lista de perguntas.
+    :param num_results: Número de documentos entregues ao modelo para cada pergunta.
+    :param use_reranking: Se deve aplicar reranking aos resultados.
+    :param initial_results: Número de documentos recuperados antes do reranking.
+    :param generate: Se deve gerar as respostas com o Gemini.
+    :param max_workers: Número máximo de chamadas simultâneas à API do Gemini.
+    :return: Lista, na ordem de entrada, de dicionários com as chaves
+             'query', 'documents', 'metadatas', 'response' e 'error'.
+    """
+    # Valida antes da recuperação para não descartar o trabalho já feito
+    if generate and max_workers < 1:
+        raise ValueError(f"max_workers deve ser maior ou igual a 1 (recebido: {max_workers}).")
+
+    if use_reranking:
+        results = query_vector_db_batch(
+            query_texts,
+            n_results=initial_results,
+            use_reranking=True,
+            rerank_top_k=num_results
+        )
+    else:
+        results = query_vector_db_batch(
+            query_texts,
+            n_results=num_results,
+            use_reranking=False
+        )
+
+    for item in results:
+        item["response"] = None
+
+    if generate:
+        to_generate = [item for item in results if not item["error"] and item["documents"]]
+        for item in results:
+            if not item["error"] and not item["documents"]:
+                item["response"] = NO_RESULTS_RESPONSE
+
+        responses = generate_responses_with_gemini_batch(
+            [item["query"] for item in to_generate],
+            [item["documents"] for item in to_generate],
+            max_workers=max_workers
+        )
+        for item, generated in zip(to_generate, responses):
+            item["response"] = generated["response"]
+            item["error"] = generated["error"]
+
+    return results
+
+def compare_with_single_query(
+        query_texts: list[str],
+        num_results: int = 3,
+        use_reranking: bool = True,
+        initial_results: int = 10
+) -> dict:
+    """
+    Mede o tempo de recuperação (busca + reranking, sem geração) do caminho em lote
+    contra chamadas sucessivas de query_vector_db, com as mesmas perguntas e parâmetros.
+    :return: Dicionário com os tempos por pergunta de cada caminho e o ganho ('speedup').
+    """
+    if use_reranking:
+        single_kwargs = {"n_results": initial_results, "use_reranking": True, "rerank_top_k": num_results}
+    else:
+        single_kwargs = {"n_results": num_results, "use_reranking": False}
+
+    # Aquece os modelos para não contar o carregamento em nenhum dos caminhos
+    query_vector_db(query_texts[0], **single_kwargs)
+
+    start_time = time.time()
+    for query_text in query_texts:
+        query_vector_db(query_text, **single_kwargs)
+    single_time = time.time() - start_time
+
+    start_time = time.time()
+    answer_queries_batch(query_texts, num_results=num_results, use_reranking=use_reranking, initial_results=initial_results)
+    batch_time = time.time() - start_time
+
+    return {
+        "queries": len(query_texts),
+        "single_seconds_per_query": single_time / len(query_texts),
+        "batch_seconds_per_query": batch_time / len(query_texts),
+        "speedup": single_time / batch_time if batch_time else float("inf")
+    }
+
+def _positive_int(value: str) -> int:
+    """argparse type for integers >= 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"deve ser maior ou igual a 1 (recebido: {value})")
+    return number
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Processa perguntas em lote sobre a REN 1000/2021 da ANEEL.")
+    parser.add_argument("input", help="Arquivo de texto com uma pergunta por linha.")
+    parser.add_argument("output", help="Arquivo JSONL de saída, um resultado por pergunta.")
+    parser.add_argument("--num-results", type=_positive_int, default=3)
+    parser.add_argument("--initial-results", type=_positive_int, default=10)
+    parser.add_argument("--no-reranking", action="store_true")
+    parser.add_argument("--generate", action="store_true", help="Gera as respostas com o Gemini.")
+    parser.add_argument("--max-workers", type=_positive_int, default=4)
+    parser.add_argument(
+        "--compare-single", type=_positive_int, metavar="N",
+        help="Antes do lote, mede o ganho da recuperação em lote sobre query_vector_db com as N primeiras perguntas."
+    )
+    args = parser.parse_args()
+
+    with open(args.input, encoding="utf-8") as f:
+        queries = [line.strip() for line in f if line.strip()]
+
+    if args.compare_single and queries:
+        comparison = compare_with_single_query(
+            queries[:args.compare_single],
+            num_results=args.num_results,
+            use_reranking=not args.no_reranking,
+            initial_results=args.initial_results
+        )
+        print(
+            f"Comparação com {comparison['queries']} perguntas: "
+            f"{comparison['single_seconds_per_query'] * 1000:.1f} ms/pergunta (individual) vs "
+            f"{comparison['batch_seconds_per_query'] * 1000:.1f} ms/pergunta (lote), "
+            f"ganho de {comparison['speedup']:.1f}x."
+        )
+
+    start_time = time.time()
+    batch_results = answer_queries_batch(
+        queries,
+        num_results=args.num_results,
+        use_reranking=not args.no_reranking,
+        initial_results=args.initial_results,
+        generate=args.generate,
+        max_workers=args.max_workers
+    )
+    elapsed = time.time() - start_time
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        for item in batch_results:
+            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+
+    errors = sum(1 for item in batch_results if item["error"])
+    print(f"{len(batch_results)} perguntas processadas em {elapsed:.1f}s ({errors} com erro). Resultados salvos em {args.output}.")
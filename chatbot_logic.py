@@ -1,28 +1,44 @@
 import google.generativeai as genai
 import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from google.api_core import exceptions as google_exceptions
 
 from dotenv import load_dotenv
 load_dotenv()
 
-def generate_response_with_gemini(query: str, context_chunks: list[str]) -> str:
+NO_RESULTS_RESPONSE = "Desculpe, não consegui encontrar informações relevantes nos documentos consultados para responder à sua pergunta."
+ERROR_RESPONSE = "Desculpe, ocorreu um erro ao tentar gerar uma resposta."
+
+# Erros da API que valem uma nova tentativa (limite de requisições e falhas temporárias)
+RETRYABLE_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.TooManyRequests,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.InternalServerError,
+    google_exceptions.DeadlineExceeded,
+)
+
+def _configure_gemini():
     """
-    Gera uma resposta usando o modelo Gemini da Google Generative AI, incorporando o contexto fornecido.
-    :param query: Texto da consulta do usuário.
-    :param context_chuncks: Lista de fragmentos de contexto que fornecem informações adicionais para a resposta.
-    :return: Resposta gerada pelo modelo Gemini.
+    Configura a chave de API do Gemini a partir da variável de ambiente GOOGLE_API_KEY.
     """
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
         raise ValueError("Erro: A chave de API do Gemini não está definida. Por favor, defina a variável de ambiente GOOGLE_API_KEY.")
-    
+
     try:
         genai.configure(api_key=api_key)
     except Exception as e:
         raise ValueError(f"Erro ao configurar a chave de API do Gemini: {e}")
-    
-    # Prepara o contexto para a consulta
+
+def _build_prompt(query: str, context_chunks: list[str]) -> str:
+    """
+    Monta o prompt enviado ao Gemini com a pergunta e os trechos de contexto.
+    """
     context_str = "\n\n---\n\n".join(context_chunks)
-    prompt = f"""
+    return f"""
 Você é um assistente de IA especializado em leis e regulamentos brasileiros da ANEEL.
 Sua tarefa é responder à pergunta do usuário com base estritamente nos trechos de lei fornecidos abaixo.
 Não utilize conhecimento externo. Se a resposta não puder ser encontrada nos trechos fornecidos,
@@ -37,11 +53,73 @@ Seja conciso e direto ao ponto. Responda em português brasileiro.
 
 **Sua Resposta:**
 """
-    
+
+def _call_gemini(query: str, context_chunks: list[str], max_retries: int = 0, backoff_seconds: float = 2.0) -> str:
+    """
+    Chama o modelo Gemini e retorna o texto gerado, propagando as exceções da API.
+    Erros de limite de requisições (429) e falhas temporárias são repetidos até `max_retries` vezes,
+    com espera exponencial (backoff_seconds * 2^tentativa, com jitter).
+    """
+    prompt = _build_prompt(query, context_chunks)
+    model = genai.GenerativeModel(model_name="gemini-1.5-flash-8b")
+
+    for attempt in range(max_retries + 1):
+        try:
+            response = model.generate_content(prompt)
+            return response.text
+        except RETRYABLE_ERRORS as e:
+            if attempt == max_retries:
+                raise
+            delay = backoff_seconds * (2 ** attempt) * (1 + random.random())
+            print(f"Erro temporário na API do Gemini: {e}. Nova tentativa em {delay:.1f}s...")
+            time.sleep(delay)
+
+def generate_response_with_gemini(query: str, context_chunks: list[str]) -> str:
+    """
+    Gera uma resposta usando o modelo Gemini da Google Generative AI, incorporando o contexto fornecido.
+    :param query: Texto da consulta do usuário.
+    :param context_chuncks: Lista de fragmentos de contexto que fornecem informações adicionais para a resposta.
+    :return: Resposta gerada pelo modelo Gemini.
+    """
+    _configure_gemini()
+
     try:
-        model = genai.GenerativeModel(model_name="gemini-1.5-flash-8b")
-        response = model.generate_content(prompt)
-        return response.text
+        return _call_gemini(query, context_chunks)
     except Exception as e:
         print(f"Erro durante a chamada de API do Gemini: {e}")
-        return "Desculpe, ocorreu um erro ao tentar gerar uma resposta."
+        return ERROR_RESPONSE
+
+def generate_responses_with_gemini_batch(
+        queries: list[str],
+        contexts: list[list[str]],
+        max_workers: int = 4,
+        max_retries: int = 3,
+        backoff_seconds: float = 2.0
+) -> list[dict]:
+    """
+    Gera respostas para várias consultas em paralelo, limitando o número de chamadas simultâneas à API do Gemini.
+    Falhas da API (após as novas tentativas) são registradas no campo 'error' do item, e não como resposta.
+    :param queries: Lista de textos de consulta.
+    :param contexts: Lista de fragmentos de contexto para cada consulta.
+    :param max_workers: Número máximo de chamadas simultâneas à API.
+    :param max_retries: Número de novas tentativas para erros 429 e falhas temporárias.
+    :param backoff_seconds: Espera base entre tentativas, dobrada a cada nova tentativa.
+    :return: Lista, na ordem de entrada, de dicionários com as chaves 'response' e 'error' (None em caso de sucesso).
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers deve ser maior ou igual a 1 (recebido: {max_workers}).")
+
+    try:
+        _configure_gemini()
+    except ValueError as e:
+        return [{"response": None, "error": str(e)} for _ in queries]
+
+    def _generate(query: str, context_chunks: list[str]) -> dict:
+        try:
+            response = _call_gemini(query, context_chunks, max_retries=max_retries, backoff_seconds=backoff_seconds)
+            return {"response": response, "error": None}
+        except Exception as e:
+            return {"response": None, "error": str(e)}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_generate, queries, contexts))
@@ -0,0 +1,140 @@
+import re
+import mmh3
+import numpy as np
+
+# Largest prime below 2^32, modulus of the universal hash family used to simulate permutations
+_HASH_PRIME = np.uint64(4294967291)
+
+def _shingles(text: str, shingle_size: int) -> set[str]:
+    """Split normalized text into overlapping word n-grams."""
+    words = re.sub(r"\s+", " ", text.lower()).strip().split(" ")
+    if len(words) <= shingle_size:
+        return {" ".join(words)}
+    return {" ".join(words[i:i + shingle_size]) for i in range(len(words) - shingle_size + 1)}
+
+def _numbers(text: str) -> list[str]:
+    """Numbers in the text, in order (deadlines, amounts, article references)."""
+    return re.findall(r"\d+", text)
+
+def _jaccard(first: set[str], second: set[str]) -> float:
+    """Exact Jaccard similarity of two shingle sets."""
+    return len(first & second) / len(first | second)
+
+def compute_minhash_signature(shingles: set[str], permutations: tuple) -> np.ndarray:
+    """
+    Compute the MinHash signature of a shingle set.
+    Each shingle is hashed once with mmh3 and the permutations are applied with
+    vectorized universal hashing ((a * h + b) mod p).
+    """
+    a, b = permutations
+    hashes = np.array(
+        [mmh3.hash(shingle, signed=False) for shingle in shingles],
+        dtype=np.uint64
+    )
+    permuted = (a[:, None] * hashes[None, :] + b[:, None]) % _HASH_PRIME
+    return permuted.min(axis=1)
+
+def _format_location(metadata: dict) -> str:
+    """Describe where a chunk comes from for the duplicate pointers."""
+    location = f"chunk {metadata.get('chunk_index')}"
+    if metadata.get("full_hierarchical_path"):
+        location += f" ({metadata['full_hierarchical_path']})"
+    return location
+
+def deduplicate_chunks(
+        chunks: list[dict],
+        threshold: float = 0.98,
+        num_perm: int = 128,
+        bands: int = 16,
+        shingle_size: int = 5,
+        seed: int = 42
+) -> tuple[list[dict], dict]:
+    """
+    Collapse near-duplicate chunks using MinHash and LSH (locality-sensitive hashing).
+    Chunks are processed in document order; the first occurrence is kept as the
+    canonical chunk and its metadata records the locations of its duplicates.
+    LSH only proposes candidates: a chunk is merged only if the exact Jaccard
+    similarity of the shingle sets reaches the threshold and both chunks contain
+    the same numbers. The default is high because provisions differing in a
+    single word or number must stay separate.
+
+    :param chunks: Chunks as returned by parse_aneel_pdf ({"page_content", "metadata"}).
+    :param threshold: Minimum Jaccard similarity to treat two chunks as duplicates.
+    :param num_perm: Number of MinHash permutations (signature length).
+    :param bands: Number of LSH bands; must divide num_perm.
+    :param shingle_size: Number of words per shingle.
+    :param seed: Seed for the permutation coefficients.
+    :return: Tuple (deduplicated_chunks, stats).
+    """
+    if num_perm % bands != 0:
+        raise ValueError(f"num_perm ({num_perm}) deve ser divisível por bands ({bands}).")
+    rows = num_perm // bands
+
+    rng = np.random.default_rng(seed)
+    permutations = (
+        rng.integers(1, 2**31, size=num_perm, dtype=np.uint64),
+        rng.integers(0, 2**31, size=num_perm, dtype=np.uint64)
+    )
+
+    lsh_buckets = {}
+    canonical = []
+    shingle_sets = []
+    number_lists = []
+    duplicates = []
+
+    for chunk in chunks:
+        shingles = _shingles(chunk["page_content"], shingle_size)
+        numbers = _numbers(chunk["page_content"])
+        signature = compute_minhash_signature(shingles, permutations)
+        band_keys = [(band, signature[band * rows:(band + 1) * rows].tobytes()) for band in range(bands)]
+
+        # Candidates are canonical chunks sharing at least one band
+        candidates = set()
+        for key in band_keys:
+            candidates.update(lsh_buckets.get(key, ()))
+
+        match = None
+        best_similarity = threshold
+        for candidate in sorted(candidates):
+            if number_lists[candidate] != numbers:
+                continue
+            similarity = _jaccard(shingle_sets[candidate], shingles)
+            if similarity >= best_similarity:
+                match, best_similarity = candidate, similarity
+
+        if match is not None:
+            duplicates[match].append(chunk["metadata"])
+            continue
+
+        index = len(canonical)
+        canonical.append(chunk)
+        shingle_sets.append(shingles)
+        number_lists.append(numbers)
+        duplicates.append([])
+        for key in band_keys:
+            lsh_buckets.setdefault(key, []).append(index)
+
+    deduplicated = []
+    for chunk, chunk_duplicates in zip(canonical, duplicates):
+        metadata = chunk["metadata"].copy()
+        metadata["total_chunks"] = len(canonical)
+        metadata["duplicate_count"] = len(chunk_duplicates)
+        if chunk_duplicates:
+            metadata["duplicate_locations"] = " | ".join(_format_location(meta) for meta in chunk_duplicates)
+        deduplicated.append({
+            "page_content": chunk["page_content"],
+            "metadata": metadata
+        })
+
+    removed = len(chunks) - len(deduplicated)
+    stats = {
+        "original_chunks": len(chunks),
+        "unique_chunks": len(deduplicated),
+        "removed_chunks": removed,
+        "reduction_pct": 100.0 * removed / len(chunks) if chunks else 0.0
+    }
+    print(
+        f"Deduplicação: {stats['original_chunks']} chunks -> {stats['unique_chunks']} "
+        f"({stats['removed_chunks']} quase-duplicados removidos, {stats['reduction_pct']:.1f}% de redução)."
+    )
+    return deduplicated, stats
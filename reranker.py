@@ -59,6 +59,57 @@ class PortugueseReranker:
         
         return results
 
+    def rerank_batch(
+        self,
+        queries: List[str],
+        documents_list: List[List[str]],
+        metadatas_list: List[List[Dict[str, Any]]] = None,
+        top_k: int = None,
+        batch_size: int = 64
+    ) -> List[List[Tuple[str, float, Dict[str, Any]]]]:
+        """
+        Rerank the documents of several queries in a single cross-encoder pass.
+        
+        All (query, document) pairs are flattened and scored together, so the
+        model runs with full batches instead of one small batch per query.
+        
+        Args:
+            queries: List of user queries
+            documents_list: List of retrieved documents for each query
+            metadatas_list: List of metadata lists corresponding to each query's documents
+            top_k: Number of top results to return per query (if None, returns all ranked)
+            batch_size: Number of pairs scored per forward pass
+        
+        Returns:
+            List (in query order) of lists of tuples (document, score, metadata)
+        """
+        # Flatten all query-document pairs, remembering where each query starts
+        pairs = []
+        offsets = []
+        for query, documents in zip(queries, documents_list):
+            offsets.append(len(pairs))
+            pairs.extend((query, doc) for doc in documents)
+        
+        scores = self.model.predict(pairs, batch_size=batch_size) if pairs else []
+        
+        all_results = []
+        for q_idx, documents in enumerate(documents_list):
+            start = offsets[q_idx]
+            metadatas = metadatas_list[q_idx] if metadatas_list else None
+            
+            results = []
+            for i, doc in enumerate(documents):
+                metadata = metadatas[i] if metadatas and i < len(metadatas) else {}
+                results.append((doc, float(scores[start + i]), metadata))
+            
+            results.sort(key=lambda x: x[1], reverse=True)
+            if top_k:
+                results = results[:top_k]
+            
+            all_results.append(results)
+        
+        return all_results
+
 # Global reranker instance (lazy loading)
 _reranker_instance = None
 
@@ -87,4 +138,24 @@ def rerank_documents(
     reranked_docs = [result[0] for result in reranked_results]
     reranked_metas = [result[2] for result in reranked_results]
     
-    return reranked_docs, reranked_metas
\ No newline at end of file
+    return reranked_docs, reranked_metas
+
+def rerank_documents_batch(
+    queries: List[str],
+    documents_list: List[List[str]],
+    metadatas_list: List[List[Dict[str, Any]]] = None,
+    top_k: int = 5
+) -> List[Tuple[List[str], List[Dict[str, Any]]]]:
+    """
+    Convenience function to rerank the documents of several queries at once.
+    
+    Returns:
+        List (in query order) of tuples (reranked_documents, reranked_metadatas)
+    """
+    reranker = get_reranker()
+    batch_results = reranker.rerank_batch(queries, documents_list, metadatas_list, top_k)
+    
+    return [
+        ([result[0] for result in results], [result[2] for result in results])
+        for results in batch_results
+    ]
\ No newline at end of file
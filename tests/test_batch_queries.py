@@ -0,0 +1,27 @@
+import pytest
+
+import batch_queries
+
+
+def test_invalid_max_workers_fails_before_retrieval(monkeypatch):
+    def fail_if_called(*args, **kwargs):
+        raise AssertionError("a recuperação não deveria ter sido executada")
+
+    monkeypatch.setattr(batch_queries, "query_vector_db_batch", fail_if_called)
+
+    with pytest.raises(ValueError):
+        batch_queries.answer_queries_batch(["q"], generate=True, max_workers=0)
+
+
+def test_queries_without_documents_get_no_results_response(monkeypatch):
+    monkeypatch.setattr(batch_queries, "query_vector_db_batch", lambda query_texts, **kwargs: [
+        {"query": q, "documents": [f"{q} doc"] if q != "vazia" else [], "metadatas": [], "error": None}
+        for q in query_texts
+    ])
+    monkeypatch.setattr(batch_queries, "generate_responses_with_gemini_batch", lambda queries, contexts, max_workers: [
+        {"response": f"resposta {q}", "error": None} for q in queries
+    ])
+
+    results = batch_queries.answer_queries_batch(["a", "vazia", "b"], generate=True)
+
+    assert [item["response"] for item in results] == ["resposta a", batch_queries.NO_RESULTS_RESPONSE, "resposta b"]
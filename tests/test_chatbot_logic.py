@@ -0,0 +1,76 @@
+import pytest
+from google.api_core import exceptions as google_exceptions
+
+import chatbot_logic
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeModel:
+    """Raises the queued errors for a query before answering it."""
+
+    errors = {}
+
+    def __init__(self, model_name):
+        pass
+
+    def generate_content(self, prompt):
+        for query, queued in FakeModel.errors.items():
+            if query in prompt and queued:
+                raise queued.pop(0)
+        return FakeResponse("resposta")
+
+
+@pytest.fixture(autouse=True)
+def fake_gemini(monkeypatch):
+    monkeypatch.setenv("GOOGLE_API_KEY", "chave")
+    monkeypatch.setattr(chatbot_logic.genai, "configure", lambda api_key: None)
+    monkeypatch.setattr(chatbot_logic.genai, "GenerativeModel", FakeModel)
+    monkeypatch.setattr(chatbot_logic.time, "sleep", lambda seconds: None)
+    FakeModel.errors = {}
+
+
+def test_batch_retries_rate_limit_errors():
+    FakeModel.errors = {"pergunta-a": [google_exceptions.ResourceExhausted("quota"), google_exceptions.ServiceUnavailable("503")]}
+
+    results = chatbot_logic.generate_responses_with_gemini_batch(["pergunta-a"], [["ctx"]], max_retries=3)
+
+    assert results == [{"response": "resposta", "error": None}]
+
+
+def test_batch_reports_api_failures_as_errors():
+    FakeModel.errors = {
+        "pergunta-a": [google_exceptions.ResourceExhausted("quota")] * 3,
+        "pergunta-b": [google_exceptions.PermissionDenied("negado")],
+    }
+
+    results = chatbot_logic.generate_responses_with_gemini_batch(
+        ["pergunta-a", "pergunta-b", "pergunta-c"], [["ctx"]] * 3, max_retries=2
+    )
+
+    assert results[0]["response"] is None and "quota" in results[0]["error"]
+    assert results[1]["response"] is None and "negado" in results[1]["error"]
+    assert results[2] == {"response": "resposta", "error": None}
+
+
+def test_batch_reports_missing_api_key_per_item(monkeypatch):
+    monkeypatch.delenv("GOOGLE_API_KEY")
+
+    results = chatbot_logic.generate_responses_with_gemini_batch(["a", "b"], [["ctx"], ["ctx"]])
+
+    assert [item["response"] for item in results] == [None, None]
+    assert all("GOOGLE_API_KEY" in item["error"] for item in results)
+
+
+def test_batch_rejects_non_positive_max_workers():
+    with pytest.raises(ValueError):
+        chatbot_logic.generate_responses_with_gemini_batch(["a"], [["ctx"]], max_workers=0)
+
+
+def test_single_path_still_returns_error_response():
+    FakeModel.errors = {"pergunta-a": [google_exceptions.ResourceExhausted("quota")]}
+
+    assert chatbot_logic.generate_response_with_gemini("pergunta-a", ["ctx"]) == chatbot_logic.ERROR_RESPONSE
@@ -0,0 +1,76 @@
+from deduplication import deduplicate_chunks
+
+ARTIGO = (
+    "Art. {numero} A distribuidora deve atender à solicitação de ligação nova do consumidor "
+    "no prazo de {prazo} dias, contados a partir da data de aprovação das instalações, "
+    "observadas as condições técnicas e comerciais estabelecidas nesta Resolução, "
+    "inclusive quanto à apresentação dos documentos exigidos, à vistoria da unidade consumidora "
+    "e ao pagamento dos custos de responsabilidade do consumidor, quando houver, "
+    "sendo vedada a exigência de quaisquer outras condições não previstas na regulação vigente."
+)
+BOILERPLATE = "Este texto não substitui o publicado no DOU. " * 20
+
+
+def make_chunks(texts):
+    return [
+        {
+            "page_content": text,
+            "metadata": {"chunk_index": i, "total_chunks": len(texts), "full_hierarchical_path": f"Art. {i}"},
+        }
+        for i, text in enumerate(texts)
+    ]
+
+
+def test_exact_duplicates_collapse_into_first_occurrence():
+    chunks = make_chunks([BOILERPLATE, ARTIGO.format(numero=1, prazo=30), BOILERPLATE, BOILERPLATE])
+
+    deduplicated, stats = deduplicate_chunks(chunks)
+
+    assert [chunk["page_content"] for chunk in deduplicated] == [BOILERPLATE, ARTIGO.format(numero=1, prazo=30)]
+    assert stats["original_chunks"] == 4
+    assert stats["unique_chunks"] == 2
+    assert stats["removed_chunks"] == 2
+    canonical = deduplicated[0]["metadata"]
+    assert canonical["duplicate_count"] == 2
+    assert canonical["duplicate_locations"] == "chunk 2 (Art. 2) | chunk 3 (Art. 3)"
+
+
+def test_legal_variant_differing_in_one_number_is_kept():
+    texts = [ARTIGO.format(numero=10, prazo=30), ARTIGO.format(numero=10, prazo=60)]
+
+    deduplicated, stats = deduplicate_chunks(make_chunks(texts))
+
+    assert [chunk["page_content"] for chunk in deduplicated] == texts
+    assert stats["removed_chunks"] == 0
+
+
+def test_legal_variant_differing_in_one_word_is_kept():
+    texts = [ARTIGO.format(numero=10, prazo=30), ARTIGO.format(numero=10, prazo=30).replace("vedada", "permitida")]
+
+    deduplicated, _ = deduplicate_chunks(make_chunks(texts))
+
+    assert len(deduplicated) == 2
+
+
+def test_order_and_metadata_are_preserved():
+    texts = [ARTIGO.format(numero=n, prazo=n * 10) for n in (3, 1, 2)]
+    chunks = make_chunks(texts)
+    chunks[1]["metadata"]["issuer"] = "ANEEL"
+
+    deduplicated, _ = deduplicate_chunks(chunks)
+
+    assert [chunk["page_content"] for chunk in deduplicated] == texts
+    assert [chunk["metadata"]["chunk_index"] for chunk in deduplicated] == [0, 1, 2]
+    assert deduplicated[1]["metadata"]["issuer"] == "ANEEL"
+    assert all(chunk["metadata"]["duplicate_count"] == 0 for chunk in deduplicated)
+    assert all("duplicate_locations" not in chunk["metadata"] for chunk in deduplicated)
+    # Input chunks are not modified
+    assert "duplicate_count" not in chunks[0]["metadata"]
+
+
+def test_total_chunks_reflects_deduplicated_count():
+    chunks = make_chunks([BOILERPLATE, BOILERPLATE, ARTIGO.format(numero=1, prazo=30)])
+
+    deduplicated, _ = deduplicate_chunks(chunks)
+
+    assert [chunk["metadata"]["total_chunks"] for chunk in deduplicated] == [2, 2]
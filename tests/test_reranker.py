@@ -0,0 +1,48 @@
+import reranker
+
+
+class FakeCrossEncoder:
+    def __init__(self, scores):
+        self.scores = scores
+        self.calls = []
+
+    def predict(self, pairs, batch_size=32):
+        self.calls.append(list(pairs))
+        return [self.scores[doc] for _, doc in pairs]
+
+
+def make_reranker(scores):
+    instance = reranker.PortugueseReranker.__new__(reranker.PortugueseReranker)
+    instance.model = FakeCrossEncoder(scores)
+    return instance
+
+
+def test_rerank_batch_scores_all_pairs_in_one_predict_call():
+    instance = make_reranker({"x": 0.1, "y": 0.9, "z": 0.5, "w": 0.3})
+
+    results = instance.rerank_batch(
+        ["q1", "q2"],
+        [["x", "y"], ["z", "w"]],
+        [[{"id": "x"}, {"id": "y"}], [{"id": "z"}, {"id": "w"}]],
+    )
+
+    assert instance.model.calls == [[("q1", "x"), ("q1", "y"), ("q2", "z"), ("q2", "w")]]
+    assert results == [
+        [("y", 0.9, {"id": "y"}), ("x", 0.1, {"id": "x"})],
+        [("z", 0.5, {"id": "z"}), ("w", 0.3, {"id": "w"})],
+    ]
+
+
+def test_rerank_batch_matches_single_query_rerank():
+    scores = {"a": 0.2, "b": 0.7, "c": 0.4}
+    instance = make_reranker(scores)
+
+    batch = instance.rerank_batch(["q1", "q2"], [["a", "b", "c"], ["c", "a"]], top_k=2)
+
+    assert batch == [instance.rerank("q1", ["a", "b", "c"], top_k=2), instance.rerank("q2", ["c", "a"], top_k=2)]
+
+
+def test_rerank_batch_handles_queries_without_documents():
+    instance = make_reranker({"a": 0.2})
+
+    assert instance.rerank_batch(["q1", "q2"], [[], ["a"]]) == [[], [("a", 0.2, {})]]
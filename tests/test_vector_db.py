@@ -0,0 +1,101 @@
+import pytest
+
+import reranker
+import vector_db
+
+
+class FakeCollection:
+    """Stand-in for a ChromaDB collection that records each query call."""
+
+    def __init__(self, failing_query=None):
+        self.failing_query = failing_query
+        self.calls = []
+
+    def query(self, query_texts, n_results):
+        self.calls.append(list(query_texts))
+        if self.failing_query in query_texts:
+            raise RuntimeError(f"falha em {self.failing_query}")
+        return {
+            "documents": [[f"{q} doc{j}" for j in range(n_results)] for q in query_texts],
+            "metadatas": [[{"query": q, "rank": j} for j in range(n_results)] for q in query_texts],
+        }
+
+
+class FakeCrossEncoder:
+    """Scores a pair by the number in the document name, so doc{n} ranks by n."""
+
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, pairs, batch_size=32):
+        self.calls.append(list(pairs))
+        return [float(doc.rsplit("doc", 1)[1]) for _, doc in pairs]
+
+
+@pytest.fixture
+def fake_reranker(monkeypatch):
+    instance = reranker.PortugueseReranker.__new__(reranker.PortugueseReranker)
+    instance.model = FakeCrossEncoder()
+    monkeypatch.setattr(reranker, "_reranker_instance", instance)
+    return instance
+
+
+def test_batch_results_follow_input_order(monkeypatch):
+    collection = FakeCollection()
+    monkeypatch.setattr(vector_db, "collection", collection)
+
+    queries = ["q2", "q0", "q1"]
+    results = vector_db.query_vector_db_batch(queries, n_results=2, use_reranking=False)
+
+    assert [item["query"] for item in results] == queries
+    assert [item["documents"][0] for item in results] == ["q2 doc0", "q0 doc0", "q1 doc0"]
+    assert all(item["error"] is None for item in results)
+    assert collection.calls == [queries]
+
+
+def test_batch_splits_queries_by_batch_size(monkeypatch):
+    collection = FakeCollection()
+    monkeypatch.setattr(vector_db, "collection", collection)
+
+    vector_db.query_vector_db_batch(["a", "b", "c"], n_results=1, use_reranking=False, query_batch_size=2)
+
+    assert collection.calls == [["a", "b"], ["c"]]
+
+
+def test_empty_queries_are_not_sent(monkeypatch):
+    collection = FakeCollection()
+    monkeypatch.setattr(vector_db, "collection", collection)
+
+    results = vector_db.query_vector_db_batch(["", "q", ""], n_results=1, use_reranking=False)
+
+    assert collection.calls == [["q"]]
+    assert results[0] == {"query": "", "documents": [], "metadatas": [], "error": None}
+    assert results[1]["documents"] == ["q doc0"]
+    assert results[2]["documents"] == []
+
+
+def test_failing_query_is_isolated(monkeypatch):
+    collection = FakeCollection(failing_query="ruim")
+    monkeypatch.setattr(vector_db, "collection", collection)
+
+    results = vector_db.query_vector_db_batch(["ok1", "ruim", "ok2"], n_results=1, use_reranking=False)
+
+    # One failed batch call, then one call per query
+    assert collection.calls == [["ok1", "ruim", "ok2"], ["ok1"], ["ruim"], ["ok2"]]
+    assert results[0]["documents"] == ["ok1 doc0"] and results[0]["error"] is None
+    assert results[1]["documents"] == [] and "ruim" in results[1]["error"]
+    assert results[2]["documents"] == ["ok2 doc0"] and results[2]["error"] is None
+
+
+def test_batch_reranks_all_queries_in_one_pass(monkeypatch, fake_reranker):
+    collection = FakeCollection()
+    monkeypatch.setattr(vector_db, "collection", collection)
+
+    results = vector_db.query_vector_db_batch(["a", "b"], n_results=5, use_reranking=True, rerank_top_k=2)
+
+    # 10 candidates per query (max(n_results * 2, 10)), scored in a single predict call
+    assert len(fake_reranker.model.calls) == 1
+    assert len(fake_reranker.model.calls[0]) == 20
+    assert results[0]["documents"] == ["a doc9", "a doc8"]
+    assert results[1]["documents"] == ["b doc9", "b doc8"]
+    assert results[1]["metadatas"] == [{"query": "b", "rank": 9}, {"query": "b", "rank": 8}]
@@ -1,9 +1,11 @@
+import time
 import chromadb
 import streamlit as st
 from chromadb.utils import embedding_functions
 
 client = None
 collection = None
+last_embedding_stats = None  # {"embedded_chunks", "embedding_seconds"} da última inicialização
 COLLECTION_NAME = "aneel_collection"
 
 def clean_metadata(metadata: dict) -> dict:
@@ -29,7 +31,7 @@ def initialize_vector_db(documents: list[str], metadatas: list[dict], persist_di
     :return: Coleção do banco de dados vetorial.
     Se a coleção já existir, ela será carregada; caso contrário, uma nova coleção será criada.
     """
-    global client, collection
+    global client, collection, last_embedding_stats
     
     # cria a função de embedding com multilingual-e5-base
     multilingual_e5 = embedding_functions.SentenceTransformerEmbeddingFunction(
@@ -61,16 +63,45 @@ def initialize_vector_db(documents: list[str], metadatas: list[dict], persist_di
         # Clean each metadata dictionary
         metadatas = [clean_metadata(metadata) for metadata in metadatas]
     
-    # Add documents with cleaned metadata
+    # Add documents with cleaned metadata (embedding happens here)
+    start_time = time.time()
     collection.add(
         documents=documents,
         ids=doc_ids,
         metadatas=metadatas
     )
+    embedding_time = time.time() - start_time
+    last_embedding_stats = {"embedded_chunks": len(documents), "embedding_seconds": embedding_time}
 
-    print(f"Banco de dados vetorial inicializado com {len(documents)} documentos usando o modelo 'multilingual-e5-base'.")
+    print(f"Banco de dados vetorial inicializado com {len(documents)} documentos usando o modelo 'multilingual-e5-base' em {embedding_time:.1f}s.")
     return collection
 
+def _ensure_collection() -> bool:
+    """
+    Garante que a coleção global esteja carregada, carregando-a do disco se necessário.
+    :return: True se a coleção estiver disponível, False caso contrário.
+    """
+    global client, collection
+    if collection:
+        return True
+
+    print("Erro: Coleção não inicializada.")
+    try:
+        multilingual_e5 = embedding_functions.SentenceTransformerEmbeddingFunction(
+            model_name="intfloat/multilingual-e5-base"
+        )
+
+        client = chromadb.PersistentClient(path=r"./chroma_db_data")
+        collection = client.get_collection(
+            name=COLLECTION_NAME,
+            embedding_function=multilingual_e5
+        )
+        print(f"Coleção '{COLLECTION_NAME}' carregada com sucesso usando intfloat/multilingual-e5-base.")
+        return True
+    except Exception as e:
+        print(f"Erro ao carregar a coleção: {e}")
+        return False
+
 def query_vector_db(query_text: str, n_results: int = 5, use_reranking: bool = True, rerank_top_k: int = None) -> list[str]:
     """
     Consulta o banco de dados vetorial ChromaDB com uma string de consulta.
@@ -82,24 +113,8 @@ def query_vector_db(query_text: str, n_results: int = 5, use_reranking: bool = T
     :param rerank_top_k: Número final de resultados após reranking (se None, usa n_results).
     :return: Lista de documentos correspondentes à consulta.
     """
-    global collection
-    if not collection:
-        print("Erro: Coleção não inicializada.")
-        try:
-            global client
-            multilingual_e5 = embedding_functions.SentenceTransformerEmbeddingFunction(
-                model_name="intfloat/multilingual-e5-base"
-            )
-
-            client = chromadb.PersistentClient(path=r"./chroma_db_data")
-            collection = client.get_collection(
-                name=COLLECTION_NAME,
-                embedding_function=multilingual_e5
-            )
-            print(f"Coleção '{COLLECTION_NAME}' carregada com sucesso usando intfloat/multilingual-e5-base.")
-        except Exception as e:
-            print(f"Erro ao carregar a coleção: {e}")
-            return []
+    if not _ensure_collection():
+        return []
     
     if not query_text:
         return []
@@ -150,4 +165,97 @@ def query_vector_db(query_text: str, n_results: int = 5, use_reranking: bool = T
     except:
         pass
     
-    return documents
\ No newline at end of file
+    return documents
+
+def query_vector_db_batch(
+    query_texts: list[str],
+    n_results: int = 5,
+    use_reranking: bool = True,
+    rerank_top_k: int = None,
+    query_batch_size: int = 256
+) -> list[dict]:
+    """
+    Consulta o banco de dados vetorial com várias strings de consulta de uma vez.
+    As consultas são embedadas e enviadas ao ChromaDB em lotes de `query_batch_size`,
+    e todos os pares (consulta, documento) são reranqueados em uma única passada do cross-encoder.
+    Destinado a tarefas em lote (pré-cálculo de FAQ, avaliação); não altera o st.session_state.
+    
+    :param query_texts: Lista de textos de consulta.
+    :param n_results: Número de resultados iniciais a serem recuperados (antes do reranking).
+    :param use_reranking: Se deve aplicar reranking aos resultados.
+    :param rerank_top_k: Número final de resultados após reranking (se None, usa n_results).
+    :param query_batch_size: Número de consultas enviadas por chamada a `collection.query`.
+    :return: Lista, na ordem de entrada, de dicionários com as chaves
+             'query', 'documents', 'metadatas' e 'error' (None em caso de sucesso).
+    """
+    results = [
+        {"query": query_text, "documents": [], "metadatas": [], "error": None}
+        for query_text in query_texts
+    ]
+
+    if not _ensure_collection():
+        for item in results:
+            item["error"] = "Coleção não inicializada."
+        return results
+
+    # Consultas vazias retornam listas vazias, como em query_vector_db
+    pending = [i for i, query_text in enumerate(query_texts) if query_text]
+    initial_results = max(n_results * 2, 10) if use_reranking else n_results
+
+    for start in range(0, len(pending), query_batch_size):
+        batch_idx = pending[start:start + query_batch_size]
+        try:
+            batch_results = collection.query(
+                query_texts=[query_texts[i] for i in batch_idx],
+                n_results=initial_results
+            )
+            batch_documents = batch_results.get('documents') or [[] for _ in batch_idx]
+            batch_metadatas = batch_results.get('metadatas') or [[] for _ in batch_idx]
+            for i, documents, metadatas in zip(batch_idx, batch_documents, batch_metadatas):
+                results[i]["documents"] = documents or []
+                results[i]["metadatas"] = metadatas or []
+        except Exception as e:
+            # Isola a consulta com problema repetindo o lote uma consulta por vez
+            print(f"Erro ao consultar lote de {len(batch_idx)} consultas: {e}. Consultando individualmente...")
+            for i in batch_idx:
+                try:
+                    single = collection.query(
+                        query_texts=[query_texts[i]],
+                        n_results=initial_results
+                    )
+                    results[i]["documents"] = single.get('documents', [[]])[0]
+                    results[i]["metadatas"] = single.get('metadatas', [[]])[0]
+                except Exception as item_error:
+                    results[i]["error"] = str(item_error)
+
+    to_rerank = [
+        item for item in results
+        if not item["error"] and len(item["documents"]) > 1
+    ]
+
+    if use_reranking and to_rerank:
+        try:
+            from reranker import rerank_documents_batch
+            final_top_k = rerank_top_k or n_results
+
+            total_pairs = sum(len(item["documents"]) for item in to_rerank)
+            print(f"Aplicando reranking em lote a {total_pairs} pares de {len(to_rerank)} consultas...")
+            reranked = rerank_documents_batch(
+                [item["query"] for item in to_rerank],
+                [item["documents"] for item in to_rerank],
+                [item["metadatas"] for item in to_rerank],
+                top_k=final_top_k
+            )
+
+            for item, (reranked_docs, reranked_metas) in zip(to_rerank, reranked):
+                item["documents"] = reranked_docs
+                item["metadatas"] = reranked_metas
+
+            print("Reranking em lote concluído.")
+
+        except ImportError:
+            print("Módulo reranker não disponível. Usando resultados sem reranking.")
+        except Exception as e:
+            print(f"Erro durante reranking em lote: {e}. Usando resultados sem reranking.")
+
+    return results
\ No newline at end of file